@@ -58,11 +58,7 @@ class FooBarBaz(ActionRunner):
 
     @override
     async def run(self, client: "PlugboardClient", websocket: ClientConnection) -> ActionResponse:
-        foo = f"{self.foo.foo} {self.foo.bar}"
-        bar = f"{self.bar.foo} {self.bar.bar}"
-        baz = f"{self.baz.foo} {self.baz.bar}"
-        hello_world = f"{self.hello} {self.world}"
         return ActionResponse(
             status_code = 200,
-            fields = f"{foo} {bar} {baz} {hello_world}"
+            fields = f"{self.foo.foo} {self.foo.bar} {self.bar.foo} {self.bar.bar} {self.baz.foo} {self.baz.bar} {self.hello} {self.world}"
         )
@@ -1,12 +1,16 @@
 from importlib import import_module
-from inspect import getmembers, isclass
-from os import listdir
+from inspect import isclass
+from os import scandir, stat
 from os.path import exists
-from typing import Any, Dict, Type
+from sys import modules
+from typing import Any, Dict, Type, cast
 
 from core.action_schema import ActionSchema
 from core.action_runner import ActionRunner
 
+# Discovered classes keyed by (path, action_type), alongside the directory mtime they were discovered at.
+_DISCOVERY_CACHE: Dict[tuple[str, Type[Any]], tuple[int, Dict[str, Type[ActionSchema]]]] = {}
+
 
 class ActionRegistry():
     """
@@ -37,6 +41,7 @@ class ActionRegistry():
     def discover(path: str, action_type: Type[Any]) -> Dict[str, Type[ActionSchema]]:
         """
         Load classes of specified action_type from directory.
+        Results are cached per path and action_type until the directory's modification time changes.
 
         Args:
             path: Directory containing action classes
@@ -54,17 +59,27 @@ class ActionRegistry():
         if action_type not in ActionRegistry.valid_action_types():
             raise ValueError(f"Invalid action type: {action_type}")
 
+        mtime = stat(path).st_mtime_ns
+        cached = _DISCOVERY_CACHE.get((path, action_type))
+        if cached is not None and cached[0] == mtime:
+            return dict(cached[1])
+
         actions: Dict[str, Type[ActionSchema]] = {}
         module_prefix = path.replace("/", ".")
 
-        for filename in listdir(path):
-            if filename.endswith(".py") and filename != "__init__.py":
-                module_name = f"{module_prefix}.{filename[:-3]}"
-                module = import_module(module_name)
-                for _, obj in getmembers(module, lambda x: isclass(x) and x.__base__ == action_type):
-                    actions[obj.discriminator()] = obj
-
-        return actions
+        with scandir(path) as entries:
+            for entry in entries:
+                if entry.name.endswith(".py") and entry.name != "__init__.py" and entry.is_file():
+                    module_name = f"{module_prefix}.{entry.name[:-3]}"
+                    module = modules.get(module_name) or import_module(module_name)
+                    for obj in vars(module).values():
+                        if isclass(obj) and obj.__base__ is action_type:
+                            # action_type is a valid action type, so a direct subclass is an ActionSchema
+                            action_class = cast(Type[ActionSchema], obj)
+                            actions[action_class.discriminator()] = action_class
+
+        _DISCOVERY_CACHE[(path, action_type)] = (mtime, actions)
+        return dict(actions)
 
     @staticmethod
     def actions(path: str, action_type: Type[Any]) -> Dict[str, Type[ActionSchema]]:
@@ -1,16 +1,22 @@
 from typing import Any, Union, override
 
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
 from core.action_schema import ActionSchema
 
 
 class ActionResponse(ActionSchema):
+    model_config = ConfigDict(frozen = True)
+
     status_code: int = Field(description = "The HTTP status code of the response")
     message: Union[str, None] = Field(description = "The message of the response", default = None)
-    fields: Union[str, int, float, bool, dict[str, Any], None] = Field(description = "The fields of the response", default = None)
+    # Not validated: any Python object is accepted here. Values that cannot be encoded as JSON only fail when the response is sent.
+    fields: Any = Field(description = "The fields of the response", default = None)
 
     @classmethod
     @override
     def description(cls) -> str:
         return "The schema used as a standard response returned by ActionRunner.run()"
+
+# The bare success response returned by the event handlers. ActionResponse is frozen, so one instance can be shared.
+OK_RESPONSE = ActionResponse(status_code = 200)
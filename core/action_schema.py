@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from json import dumps, loads
+from copy import deepcopy
+from functools import cache
+from json import dumps
 from typing import Any, Type, cast
 
 from pydantic import BaseModel
@@ -39,6 +41,18 @@ class ActionSchema(BaseModel, ABC):
     def to_dict(cls) -> dict[str, Any]:
         """
         Returns the action_schema definition as a dictionary.
+        The definition is computed once per class; each call returns a copy the caller is free to modify.
+
+        Returns:
+            dict: The action_schema definition as a dictionary.
+        """
+        return deepcopy(cls._cached_dict())
+
+    @classmethod
+    @cache
+    def _cached_dict(cls) -> dict[str, Any]:
+        """
+        Builds the action_schema definition once per class. The result is shared and must not be modified.
 
         Returns:
             dict: The action_schema definition as a dictionary.
@@ -67,26 +81,17 @@ class ActionSchema(BaseModel, ABC):
                     nested_fields: dict[str, Any] = {}
                     nested_fields["type"] = action_schema_class.discriminator()
                     nested_fields["description"] = action_schema_class.description()
-                    nested_fields["fields"] = next(
-                        iter(
-                            loads(
-                                action_schema_class.to_json()
-                            ).values()
-                        )
-                    )["fields"]
+                    nested_fields["fields"] = action_schema_class._cached_dict()[action_schema_class.__name__]["fields"]
                     fields[field_name] = nested_fields
                     continue
 
-            field_data: dict[str, Any] = {
-                "type": field_type,
-                "description": field_schema.get("description"),
-                "default": field_schema.get("default") if "default" in field_schema else None
-            }
             field_info: dict[str, Any] = {
-                key: value
-                for key, value in field_data.items()
-                if key != "default" or ("default" in field_schema)
+                "type": field_type,
+                "description": field_schema.get("description")
             }
+            # Only include a default when the field declares one
+            if "default" in field_schema:
+                field_info["default"] = field_schema["default"]
             fields[field_name] = field_info
 
         return {
@@ -97,9 +102,11 @@ class ActionSchema(BaseModel, ABC):
         }
 
     @classmethod
+    @cache
     def to_json(cls, indent: int | None = None) -> str:
         """
         Returns the action_schema definition as a JSON schema.
+        The result is computed once per class and indent, and cached.
 
         Args:
             indent (int, optional): The indentation level for the JSON schema. Defaults to None.
@@ -107,4 +114,4 @@ class ActionSchema(BaseModel, ABC):
         Returns:
             str: The JSON schema for the action action_schema.
         """
-        return dumps(cls.to_dict(), indent = indent)
+        return dumps(cls._cached_dict(), indent = indent)
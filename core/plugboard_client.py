@@ -1,17 +1,47 @@
-from json import JSONDecodeError, dumps, loads
-from typing import Any, Type
+from asyncio import Semaphore, Task, create_task, gather
+from typing import Annotated, Any, Literal, Type, Union, get_args, get_origin
 from urllib.parse import quote
 
-from pydantic import BaseModel, Field, ValidationError
+from orjson import dumps
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 from websockets import ClientConnection, ConnectionClosed, connect
 
 from core.action_registry import ActionRegistry
+from core.action_response import ActionResponse
 from core.action_runner import ActionRunner
 from events.phx_join_event import PhxJoinEvent
+from events.request_event import RequestEvent
 from schemas.service import Service
 from schemas.token import Token
 
 
+def _event_adapter(events: dict[str, Type[ActionRunner]]) -> TypeAdapter[ActionRunner] | None:
+    """
+    Builds a TypeAdapter that parses a frame into the event class tagged by its "event" field.
+
+    Args:
+        events (dict[str, Type[ActionRunner]]): The event classes keyed by their event name.
+
+    Raises:
+        ValueError: If an event class does not declare its key as a Literal "event" field.
+
+    Returns:
+        TypeAdapter[ActionRunner] | None: The adapter, or None if no events are registered.
+    """
+    mismatched: list[str] = []
+    for name, event_class in events.items():
+        field = event_class.model_fields.get("event")
+        annotation = None if field is None else field.annotation
+        if get_origin(annotation) is not Literal or get_args(annotation) != (name,):
+            mismatched.append(f"{name} ({event_class.__name__})")
+    if mismatched:
+        raise ValueError(f"Events must declare their name as a Literal \"event\" field: {', '.join(mismatched)}")
+
+    # With no event handlers registered there is no union to build, and every frame is an unknown event.
+    if not events:
+        return None
+    return TypeAdapter(Annotated[Union[tuple(events.values())], Field(discriminator = "event")])
+
 class PlugboardClient(BaseModel):
     """
     This class represents a client for the Plugboard application.
@@ -24,6 +54,7 @@ class PlugboardClient(BaseModel):
         connected (bool): A flag indicating whether this client is connected to the service.
         events (dict[str, ActionRunner]): A dictionary of event handlers.
         actions (dict[str, ActionRunner]): A dictionary of action handlers.
+        max_concurrent_requests (int): The maximum number of request events handled at once.
 
     Methods:
         connect(websocket_url: str, service_id: str | int, token: str): Connects to the Plugboard application and handles events.
@@ -34,23 +65,51 @@ class PlugboardClient(BaseModel):
     connected: bool = Field(default = False)
     events: dict[str, Type[ActionRunner]] = Field(default_factory = lambda: ActionRegistry.discover("events", ActionRunner))
     actions: dict[str, Type[ActionRunner]] = Field(default_factory = lambda: ActionRegistry.discover("actions", ActionRunner))
+    max_concurrent_requests: int = Field(default = 64, gt = 0)
 
     async def __loop(self, websocket: ClientConnection) -> None:
-        await websocket.send(PhxJoinEvent(topic = "service").model_dump_json())
+        # Events are tagged by their "event" field, so pydantic-core can parse and dispatch each frame in a single pass.
+        events = _event_adapter(self.events)
+        requests: set[Task[ActionResponse]] = set()
+        # Once every slot is taken the loop stops reading frames, so a flood of requests backs up in the websocket instead of in memory.
+        slots = Semaphore(self.max_concurrent_requests)
+
+        def request_done(task: Task[ActionResponse]) -> None:
+            requests.discard(task)
+            slots.release()
+            if not task.cancelled() and (error := task.exception()) is not None:
+                print(f"Request failed: {error!r}")
+
+        await websocket.send(PhxJoinEvent.model_construct(topic = "service").model_dump_json())
         while self.connected:
             try:
-                message = loads(await websocket.recv())
-                await self.events[message["event"]](**message).run(self, websocket)
-            except JSONDecodeError:
-                print("Invalid JSON")
-            except KeyError:
-                print("Invalid message")
+                # pydantic-core validates UTF-8 while parsing, so skip the websockets decode pass.
+                message = await websocket.recv(decode = False)
+                if events is None:
+                    print("Invalid message")
+                    continue
+                event = events.validate_json(message)
+                if isinstance(event, RequestEvent):
+                    # Requests run concurrently so a slow action does not hold up the frames behind it.
+                    await slots.acquire()
+                    task = create_task(event.run(self, websocket))
+                    requests.add(task)
+                    task.add_done_callback(request_done)
+                else:
+                    await event.run(self, websocket)
             except ValidationError as error:
-                print(f"Invalid event: {error}")
+                error_type = error.errors()[0]["type"]
+                if error_type == "json_invalid":
+                    print("Invalid JSON")
+                elif error_type in ("union_tag_not_found", "union_tag_invalid"):
+                    print("Invalid message")
+                else:
+                    print(f"Invalid event: {error}")
             except ConnectionClosed:
                 self.connected = False
             except ConnectionAbortedError:
                 self.connected = False
+        await gather(*requests, return_exceptions = True)
 
     async def connect(self, websocket_url: str, token: str) -> None:
         """
@@ -63,14 +122,14 @@ class PlugboardClient(BaseModel):
 
         Raises:
             InvalidStatus: If the connection is not successful. Could be caused by invalid url, token or actions.
-            JSONDecodeError: If the JSON message cannot be decoded.
-            KeyError: If the message is not recognized.
-            ValidationError: If the event is not recognized.
-            ConnectionClosed: If the connection is closed.
+            ValueError: If a registered event does not declare its name as a Literal "event" field.
         """
         if self.connected:
             return
         self.token.value = token
-        async with connect(f"{websocket_url}?token={token}&actions={quote(dumps({k: v for action in self.actions.values() for k, v in action.to_dict().items()}))}") as websocket:
+        async with connect(
+            f"{websocket_url}?token={token}&actions={quote(dumps({k: v for action in self.actions.values() for k, v in action.to_dict().items()}))}",
+            compression = None
+        ) as websocket:
             self.connected = True
             await self.__loop(websocket)
@@ -1,6 +1,11 @@
-from asyncio import run
 from os import getenv
 
+try:
+    from uvloop import run
+except ImportError:
+    # uvloop does not support Windows, so fall back to the default event loop there.
+    from asyncio import run
+
 from core.plugboard_client import PlugboardClient
 
 if __name__ == "__main__":
@@ -4,7 +4,7 @@ from pydantic import Field
 from websockets import ClientConnection
 
 from core.action_schema import ActionSchema
-from core.action_response import ActionResponse
+from core.action_response import OK_RESPONSE, ActionResponse
 from core.action_runner import ActionRunner
 
 if TYPE_CHECKING:
@@ -52,6 +52,4 @@ class ConsumerConnectedEvent(ActionRunner):
     @override
     async def run(self, client: "PlugboardClient", websocket: ClientConnection) -> ActionResponse:
         client.num_consumers = self.payload.num_consumers
-        return ActionResponse(
-            status_code = 200
-        )
+        return OK_RESPONSE
@@ -4,7 +4,7 @@ from pydantic import Field
 from websockets import ClientConnection
 
 from core.action_schema import ActionSchema
-from core.action_response import ActionResponse
+from core.action_response import OK_RESPONSE, ActionResponse
 from core.action_runner import ActionRunner
 
 if TYPE_CHECKING:
@@ -49,6 +49,4 @@ class PhxJoinEvent(ActionRunner):
 
     @override
     async def run(self, client: "PlugboardClient", websocket: ClientConnection) -> ActionResponse:
-        return ActionResponse(
-            status_code = 200
-        )
+        return OK_RESPONSE
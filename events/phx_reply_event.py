@@ -4,7 +4,7 @@ from pydantic import Field
 from websockets import ClientConnection
 
 from core.action_schema import ActionSchema
-from core.action_response import ActionResponse
+from core.action_response import OK_RESPONSE, ActionResponse
 from core.action_runner import ActionRunner
 from schemas.service import Service
 from schemas.token import Token
@@ -120,6 +120,4 @@ class PhxReplyEvent(ActionRunner):
 
         client.service = self.payload.response.service
         client.num_consumers = self.payload.response.num_consumers
-        return ActionResponse(
-            status_code = 200
-        )
+        return OK_RESPONSE
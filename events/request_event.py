@@ -1,6 +1,7 @@
-from json import dumps
+from json import dumps as json_dumps
 from typing import TYPE_CHECKING, Any, Literal, override
 
+from orjson import OPT_NON_STR_KEYS, JSONEncodeError, dumps
 from pydantic import Field, ValidationError
 from websockets import ClientConnection
 
@@ -11,6 +12,35 @@ from core.action_schema import ActionSchema
 if TYPE_CHECKING:
     from core.plugboard_client import PlugboardClient
 
+_INVALID_REQUEST_RESPONSE = ActionResponse(
+    status_code = 400,
+    message = "Invalid request. Please check the required fields and try again."
+)
+_INTERNAL_SERVER_ERROR_RESPONSE = ActionResponse(
+    status_code = 500,
+    message = "Internal server error"
+)
+
+def _encode(message: dict[str, Any]) -> str:
+    """
+    Encodes a response message as JSON, using orjson where it can.
+
+    Args:
+        message (dict[str, Any]): The message to encode.
+
+    Raises:
+        TypeError: If the message contains a value that cannot be serialized.
+        ValueError: If the message contains a circular reference.
+
+    Returns:
+        str: The JSON encoded message.
+    """
+    try:
+        return dumps(message, option = OPT_NON_STR_KEYS).decode()
+    except JSONEncodeError:
+        # orjson rejects some values the standard library accepts, such as integers wider than 64 bits.
+        return json_dumps(message)
+
 class RequestEvent(ActionRunner):
     """
     Represents a request event to be be handled by the corresponding action runner.
@@ -54,6 +84,14 @@ class RequestEvent(ActionRunner):
     def description(cls) -> str:
         return "Represents a request event to be be handled by the corresponding action runner."
 
+    def __response_message(self, response: ActionResponse) -> dict[str, Any]:
+        return {
+            "topic": self.topic,
+            "event": "response",
+            "payload": response.model_dump(),
+            "ref": self.payload.response_ref
+        }
+
     @override
     async def run(self, client: "PlugboardClient", websocket: ClientConnection) -> ActionResponse:
         try:
@@ -64,23 +102,13 @@ class RequestEvent(ActionRunner):
                 message = f"Unknown action: {self.payload.action}",
             )
         except ValidationError:
-            response = ActionResponse(
-                status_code = 400,
-                message = "Invalid request. Please check the required fields and try again."
-            )
+            response = _INVALID_REQUEST_RESPONSE
         except Exception:
-            response = ActionResponse(
-                status_code = 500,
-                message = "Internal server error"
-            )
-        await websocket.send(
-            dumps(
-                {
-                    "topic": self.topic,
-                    "event": "response",
-                    "payload": response.model_dump(),
-                    "ref": self.payload.response_ref
-                }
-            )
-        )
+            response = _INTERNAL_SERVER_ERROR_RESPONSE
+        try:
+            message = _encode(self.__response_message(response))
+        except (TypeError, ValueError):
+            response = _INTERNAL_SERVER_ERROR_RESPONSE
+            message = _encode(self.__response_message(response))
+        await websocket.send(message)
         return response
@@ -4,7 +4,7 @@ from pydantic import Field
 from websockets import ClientConnection
 
 from core.action_schema import ActionSchema
-from core.action_response import ActionResponse
+from core.action_response import OK_RESPONSE, ActionResponse
 from core.action_runner import ActionRunner
 from schemas.service import Service
 
@@ -53,6 +53,4 @@ class ServiceUpdatedEvent(ActionRunner):
     @override
     async def run(self, client: "PlugboardClient", websocket: ClientConnection) -> ActionResponse:
         client.service = self.payload.service
-        return ActionResponse(
-            status_code = 200
-        )
+        return OK_RESPONSE
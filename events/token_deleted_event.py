@@ -4,7 +4,7 @@ from pydantic import Field
 from websockets import ClientConnection
 
 from core.action_schema import ActionSchema
-from core.action_response import ActionResponse
+from core.action_response import OK_RESPONSE, ActionResponse
 from core.action_runner import ActionRunner
 from schemas.token import Token
 
@@ -52,6 +52,4 @@ class TokenDeletedEvent(ActionRunner):
 
     @override
     async def run(self, client: "PlugboardClient", websocket: ClientConnection) -> ActionResponse:
-        return ActionResponse(
-            status_code = 200
-        )
+        return OK_RESPONSE
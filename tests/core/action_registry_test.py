@@ -115,6 +115,39 @@ class ActionRegistryTest(TestCase):
         runner_result = ActionRegistry.discover("actions", ActionRunner)
         self.assertIsInstance(runner_result, dict)
 
+    def test_discover_caches_results(self) -> None:
+        """Test discover reuses cached results for an unchanged directory."""
+        first = ActionRegistry.discover("actions", ActionRunner)
+
+        with patch("core.action_registry.scandir") as mock_scandir:
+            second = ActionRegistry.discover("actions", ActionRunner)
+            mock_scandir.assert_not_called()
+
+        self.assertEqual(first, second)
+        # Each caller gets its own copy of the cached dictionary
+        self.assertIsNot(first, second)
+
+    def test_discover_rescans_changed_directory(self) -> None:
+        """Test discover picks up new classes once the directory changes."""
+        with tempfile.TemporaryDirectory(dir = ".") as temp_dir:
+            path = os.path.basename(temp_dir)
+            self.assertEqual(ActionRegistry.discover(path, ActionSchema), {})
+
+            with open(os.path.join(path, "late_action.py"), "w") as f:
+                f.write("""
+from core.action_schema import ActionSchema
+
+class LateAction(ActionSchema):
+    @classmethod
+    def description(cls) -> str:
+        return "Late action"
+""")
+            # Force a distinct modification time regardless of filesystem timestamp granularity
+            os.utime(path, ns = (1, 1))
+
+            result = ActionRegistry.discover(path, ActionSchema)
+            self.assertIn("LateAction", result)
+
     def test_actions_method_calls_discover(self) -> None:
         """Test actions method calls discover with correct parameters."""
         with patch.object(ActionRegistry, 'discover') as mock_discover:
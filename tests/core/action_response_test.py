@@ -1,5 +1,8 @@
 from unittest import TestCase
 
+from pydantic import ValidationError
+from pydantic_core import PydanticSerializationError
+
 from core.action_response import ActionResponse
 
 
@@ -201,6 +204,49 @@ class ActionResponseTest(TestCase):
         self.assertIsNone(response.message)
         self.assertIsNone(response.fields)
 
+    def test_action_response_with_list_fields(self) -> None:
+        """
+        Test ActionResponse with list fields.
+
+        Returns:
+            None: This test does not return a value.
+        """
+        response = ActionResponse(
+            status_code = 200,
+            fields = [1, "two", {"three": 3}]
+        )
+
+        self.assertEqual(response.fields, [1, "two", {"three": 3}])
+
+    def test_action_response_with_unserializable_fields(self) -> None:
+        """
+        Test that ActionResponse accepts fields that cannot be serialized, which then fail at encode time.
+
+        Returns:
+            None: This test does not return a value.
+        """
+        value = object()
+        response = ActionResponse(
+            status_code = 200,
+            fields = value
+        )
+
+        self.assertIs(response.fields, value)
+        with self.assertRaises(PydanticSerializationError):
+            response.model_dump_json()
+
+    def test_action_response_is_immutable(self) -> None:
+        """
+        Test that ActionResponse instances cannot be modified after creation.
+
+        Returns:
+            None: This test does not return a value.
+        """
+        response = ActionResponse(status_code = 200)
+
+        with self.assertRaises(ValidationError):
+            response.status_code = 500
+
 
 if __name__ == "__main__":
     from unittest import main
@@ -110,6 +110,54 @@ class ActionSchemaTest(TestCase):
         parsed = loads(json_str)
         self.assertIsInstance(parsed, dict)
 
+    def test_to_dict_is_cached_per_class(self) -> None:
+        """
+        Test that to_dict caches its result separately for each class.
+
+        Returns:
+            None: This test does not return a value.
+        """
+        class SubclassAction(self.test_action_class):  # type: ignore
+            @classmethod
+            @override
+            def description(cls) -> str:
+                return "Subclass action"
+
+        self.assertIs(self.test_action_class._cached_dict(), self.test_action_class._cached_dict())  # type: ignore
+        self.assertEqual(SubclassAction.to_dict()["SubclassAction"]["description"], "Subclass action")
+        self.assertEqual(self.test_action_class.to_dict()["TestAction"]["description"], "Test action for unit testing")
+
+    def test_to_dict_mutation_does_not_reach_cache(self) -> None:
+        """
+        Test that modifying the result of to_dict does not change later results, including nested schemas.
+
+        Returns:
+            None: This test does not return a value.
+        """
+        class NestedAction(ActionSchema):
+            nested_name: str = Field(description = "Nested name")
+
+            @classmethod
+            @override
+            def description(cls) -> str:
+                return "Nested action"
+
+        class ParentAction(ActionSchema):
+            nested: NestedAction = Field(description = "Nested action field")
+
+            @classmethod
+            @override
+            def description(cls) -> str:
+                return "Parent action"
+
+        ParentAction.to_dict()["ParentAction"]["fields"]["nested"]["fields"]["nested_name"]["description"] = "HACKED"
+        NestedAction.to_dict()["NestedAction"]["description"] = "HACKED"
+
+        self.assertEqual(ParentAction.to_dict()["ParentAction"]["fields"]["nested"]["fields"]["nested_name"]["description"], "Nested name")
+        self.assertEqual(NestedAction.to_dict()["NestedAction"]["fields"]["nested_name"]["description"], "Nested name")
+        self.assertEqual(NestedAction.to_dict()["NestedAction"]["description"], "Nested action")
+        self.assertNotIn("HACKED", ParentAction.to_json())
+
     def test_abstract_methods_must_be_implemented(self) -> None:
         """
         Test that subclasses must implement abstract methods.
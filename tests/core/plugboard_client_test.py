@@ -120,7 +120,7 @@ class PlugboardClientTest(TestCase):
             # Mock PhxJoinEvent
             mock_join_event = MagicMock()
             mock_join_event.model_dump_json.return_value = '{"event": "phx_join"}'
-            mock_phx_join.return_value = mock_join_event
+            mock_phx_join.model_construct.return_value = mock_join_event
 
             # Mock the loop to exit immediately
             with patch.object(self.client, '_PlugboardClient__loop', new_callable=AsyncMock) as mock_loop:
@@ -175,7 +175,7 @@ class PlugboardClientTest(TestCase):
             # Mock PhxJoinEvent
             mock_join_event = MagicMock()
             mock_join_event.model_dump_json.return_value = '{"event": "phx_join"}'
-            mock_phx_join.return_value = mock_join_event
+            mock_phx_join.model_construct.return_value = mock_join_event
 
             # Mock the loop to exit immediately
             with patch.object(self.client, '_PlugboardClient__loop', new_callable=AsyncMock) as mock_loop:
@@ -187,6 +187,7 @@ class PlugboardClientTest(TestCase):
                 mock_connect.assert_called_once()
                 call_args = mock_connect.call_args[0]
                 self.assertTrue(call_args[0].startswith("ws://test.com?token=test_token&actions="))
+                self.assertIsNone(mock_connect.call_args.kwargs["compression"])
 
         asyncio.run(async_test())
 
@@ -213,12 +214,12 @@ class PlugboardClientTest(TestCase):
             # Mock PhxJoinEvent
             mock_join_event = MagicMock()
             mock_join_event.model_dump_json.return_value = '{"event": "phx_join"}'
-            mock_phx_join.return_value = mock_join_event
+            mock_phx_join.model_construct.return_value = mock_join_event
 
             await self.client.connect("ws://test.com", "test_token")
 
             # Check that PhxJoinEvent was created and sent
-            mock_phx_join.assert_called_once_with(topic="service")
+            mock_phx_join.model_construct.assert_called_once_with(topic="service")
             mock_websocket.send.assert_called()
 
         asyncio.run(async_test())
@@ -248,9 +249,33 @@ class PlugboardClientTest(TestCase):
 
         asyncio.run(async_test())
 
-    def test_loop_handles_key_error(self) -> None:
+    def test_loop_reads_raw_frames(self) -> None:
         """
-        Test that __loop handles KeyError gracefully.
+        Test that __loop reads frames as bytes and reports invalid UTF-8 as invalid JSON.
+
+        Returns:
+            None: This test does not return a value.
+        """
+        async def async_test() -> None:
+            mock_websocket = AsyncMock()
+            # First call returns a frame with invalid UTF-8, second call raises ConnectionClosed to break the loop
+            mock_websocket.recv.side_effect = [b'{"event": "phx_join", "topic": "\xff"}', ConnectionClosed(None, None)]
+
+            # Set connected to True so the loop runs
+            self.client.connected = True
+
+            with patch('builtins.print') as mock_print:
+                # Type ignore for private method access
+                await self.client._PlugboardClient__loop(mock_websocket)  # type: ignore
+
+                mock_websocket.recv.assert_called_with(decode = False)
+                mock_print.assert_called_once_with("Invalid JSON")
+
+        asyncio.run(async_test())
+
+    def test_loop_handles_missing_event(self) -> None:
+        """
+        Test that __loop handles messages without an event gracefully.
 
         Returns:
             None: This test does not return a value.
@@ -273,6 +298,79 @@ class PlugboardClientTest(TestCase):
 
         asyncio.run(async_test())
 
+    def test_loop_handles_unknown_event(self) -> None:
+        """
+        Test that __loop handles messages with an unknown event gracefully.
+
+        Returns:
+            None: This test does not return a value.
+        """
+        async def async_test() -> None:
+            mock_websocket = AsyncMock()
+            # First call returns an unknown event, second call raises ConnectionClosed to break the loop
+            mock_websocket.recv.side_effect = ['{"event": "unknown_event", "topic": "service"}', ConnectionClosed(None, None)]
+
+            # Set connected to True so the loop runs
+            self.client.connected = True
+
+            with patch('builtins.print') as mock_print:
+                # Type ignore for private method access
+                await self.client._PlugboardClient__loop(mock_websocket)  # type: ignore
+
+                # Should print "Invalid message"
+                mock_print.assert_called_with("Invalid message")
+
+        asyncio.run(async_test())
+
+    def test_loop_handles_no_registered_events(self) -> None:
+        """
+        Test that __loop treats every message as unknown when no events are registered.
+
+        Returns:
+            None: This test does not return a value.
+        """
+        async def async_test() -> None:
+            mock_websocket = AsyncMock()
+            # First call returns a well-formed event, second call raises ConnectionClosed to break the loop
+            mock_websocket.recv.side_effect = ['{"event": "phx_join", "topic": "service"}', ConnectionClosed(None, None)]
+
+            client = PlugboardClient(events = {})
+            client.connected = True
+
+            with patch('builtins.print') as mock_print:
+                # Type ignore for private method access
+                await client._PlugboardClient__loop(mock_websocket)  # type: ignore
+
+                # Should print "Invalid message"
+                mock_print.assert_called_once_with("Invalid message")
+                self.assertFalse(client.connected)
+
+        asyncio.run(async_test())
+
+    def test_loop_rejects_mismatched_event_names(self) -> None:
+        """
+        Test that __loop reports an event registered under a name other than its "event" literal.
+
+        Returns:
+            None: This test does not return a value.
+        """
+        async def async_test() -> None:
+            from events.phx_join_event import PhxJoinEvent
+
+            mock_websocket = AsyncMock()
+            client = PlugboardClient(events = {"join": PhxJoinEvent})
+            client.connected = True
+
+            with self.assertRaises(ValueError) as context:
+                # Type ignore for private method access
+                await client._PlugboardClient__loop(mock_websocket)  # type: ignore
+
+            self.assertIn("join (PhxJoinEvent)", str(context.exception))
+            # The adapter is checked before the join frame goes out
+            mock_websocket.send.assert_not_called()
+
+        asyncio.run(async_test())
+
     def test_loop_handles_validation_error(self) -> None:
         """
         Test that __loop handles ValidationError gracefully.
@@ -281,23 +379,170 @@ class PlugboardClientTest(TestCase):
             None: This test does not return a value.
         """
         async def async_test() -> None:
-            from pydantic import ValidationError
+            mock_websocket = AsyncMock()
+            # First call returns a request event without a payload, second call raises ConnectionClosed to break the loop
+            mock_websocket.recv.side_effect = ['{"event": "request", "topic": "service"}', ConnectionClosed(None, None)]
+
+            # Set connected to True so the loop runs
+            self.client.connected = True
+
+            with patch('builtins.print') as mock_print:
+                # Type ignore for private method access
+                await self.client._PlugboardClient__loop(mock_websocket)  # type: ignore
+
+                # Should print validation error
+                mock_print.assert_called_once()
+                self.assertTrue(mock_print.call_args[0][0].startswith("Invalid event:"))
+
+        asyncio.run(async_test())
+
+    def test_loop_dispatches_event_by_name(self) -> None:
+        """
+        Test that __loop runs the event matching the message's event name.
+
+        Returns:
+            None: This test does not return a value.
+        """
+        async def async_test() -> None:
+            mock_websocket = AsyncMock()
+            # First call returns a num_consumers event, second call raises ConnectionClosed to break the loop
+            mock_websocket.recv.side_effect = [
+                '{"event": "num_consumers", "topic": "service", "payload": {"num_consumers": 3}}',
+                ConnectionClosed(None, None)
+            ]
+
+            # Set connected to True so the loop runs
+            self.client.connected = True
+
+            # Type ignore for private method access
+            await self.client._PlugboardClient__loop(mock_websocket)  # type: ignore
+
+            self.assertEqual(self.client.num_consumers, 3)
+
+        asyncio.run(async_test())
+
+    def test_loop_does_not_block_on_request_events(self) -> None:
+        """
+        Test that __loop keeps handling frames while a request event is still running.
+
+        Returns:
+            None: This test does not return a value.
+        """
+        async def async_test() -> None:
+            from events.request_event import RequestEvent
+
+            release = asyncio.Event()
+            seen_num_consumers: list[int] = []
+
+            async def slow_run(event: RequestEvent, client: PlugboardClient, websocket: AsyncMock) -> None:
+                await release.wait()
+                seen_num_consumers.append(client.num_consumers)
+
+            frames = [
+                '{"event": "request", "topic": "service", "payload": {"action": "Foo", "fields": {}}}',
+                '{"event": "num_consumers", "topic": "service", "payload": {"num_consumers": 3}}'
+            ]
+
+            async def recv(decode: bool | None = None) -> str:
+                if frames:
+                    return frames.pop(0)
+                # Let the pending request finish once every frame has been received
+                release.set()
+                raise ConnectionClosed(None, None)
+
+            mock_websocket = AsyncMock()
+            mock_websocket.recv.side_effect = recv
+
+            # Set connected to True so the loop runs
+            self.client.connected = True
+
+            with patch.object(RequestEvent, "run", slow_run):
+                # Type ignore for private method access; the timeout fails the test instead of hanging if requests block the loop
+                await asyncio.wait_for(self.client._PlugboardClient__loop(mock_websocket), timeout = 1)  # type: ignore
+
+            # The num_consumers frame was handled before the request completed
+            self.assertEqual(seen_num_consumers, [3])
+
+        asyncio.run(async_test())
+
+    def test_loop_reports_failed_request_events(self) -> None:
+        """
+        Test that __loop reports a request event that raised instead of dropping it silently.
+
+        Returns:
+            None: This test does not return a value.
+        """
+        async def async_test() -> None:
+            from events.request_event import RequestEvent
+
+            async def failing_run(event: RequestEvent, client: PlugboardClient, websocket: AsyncMock) -> None:
+                raise ConnectionClosed(None, None)
 
             mock_websocket = AsyncMock()
-            # First call returns test event, second call raises ConnectionClosed to break the loop
-            mock_websocket.recv.side_effect = ['{"event": "test_event"}', ConnectionClosed(None, None)]
+            # First call returns a request event, second call raises ConnectionClosed to break the loop
+            mock_websocket.recv.side_effect = [
+                '{"event": "request", "topic": "service", "payload": {"action": "Foo", "fields": {}}}',
+                ConnectionClosed(None, None)
+            ]
 
             # Set connected to True so the loop runs
             self.client.connected = True
 
-            # Mock the event handler to raise ValidationError
-            with patch.dict(self.client.events, {"test_event": MagicMock(side_effect=ValidationError.from_exception_data("TestError", []))}):
-                with patch('builtins.print') as mock_print:
-                    # Type ignore for private method access
-                    await self.client._PlugboardClient__loop(mock_websocket)  # type: ignore
+            with patch.object(RequestEvent, "run", failing_run), patch('builtins.print') as mock_print:
+                # Type ignore for private method access
+                await self.client._PlugboardClient__loop(mock_websocket)  # type: ignore
+
+                mock_print.assert_called_once()
+                self.assertTrue(mock_print.call_args[0][0].startswith("Request failed:"))
+
+        asyncio.run(async_test())
+
+    def test_loop_limits_concurrent_request_events(self) -> None:
+        """
+        Test that __loop stops reading frames while max_concurrent_requests request events are running.
+
+        Returns:
+            None: This test does not return a value.
+        """
+        async def async_test() -> None:
+            from events.request_event import RequestEvent
+
+            release = asyncio.Event()
+            running = 0
+            peak = 0
+
+            async def slow_run(event: RequestEvent, client: PlugboardClient, websocket: AsyncMock) -> None:
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await release.wait()
+                running -= 1
+
+            frames = [
+                '{"event": "request", "topic": "service", "payload": {"action": "Foo", "fields": {}}}',
+                '{"event": "request", "topic": "service", "payload": {"action": "Foo", "fields": {}}}',
+                '{"event": "request", "topic": "service", "payload": {"action": "Foo", "fields": {}}}'
+            ]
+
+            async def recv(decode: bool | None = None) -> str:
+                if frames:
+                    # Let the running requests finish once the loop is waiting on the limit
+                    if len(frames) == 1:
+                        asyncio.get_running_loop().call_later(0.05, release.set)
+                    return frames.pop(0)
+                raise ConnectionClosed(None, None)
+
+            mock_websocket = AsyncMock()
+            mock_websocket.recv.side_effect = recv
+
+            client = PlugboardClient(max_concurrent_requests = 2)
+            client.connected = True
+
+            with patch.object(RequestEvent, "run", slow_run):
+                # Type ignore for private method access; the timeout fails the test instead of hanging if the limit is never released
+                await asyncio.wait_for(client._PlugboardClient__loop(mock_websocket), timeout = 1)  # type: ignore
 
-                    # Should print validation error
-                    mock_print.assert_called()
+            self.assertEqual(peak, 2)
 
         asyncio.run(async_test())
 
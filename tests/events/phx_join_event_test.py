@@ -3,7 +3,7 @@ from typing import Any, override
 from unittest import TestCase
 from unittest.mock import Mock
 
-from core.action_response import ActionResponse
+from core.action_response import OK_RESPONSE, ActionResponse
 from events.phx_join_event import PhxJoinEvent
 
 
@@ -231,6 +231,17 @@ class PhxJoinEventTest(TestCase):
 
         asyncio.run(async_test())
 
+    def test_run_method_returns_shared_success_response(self) -> None:
+        """
+        Test that run method returns the shared OK_RESPONSE instead of building a new response.
+
+        Returns:
+            None: This test does not return a value.
+        """
+        result = asyncio.run(self.phx_join_event.run(Mock(), Mock()))
+
+        self.assertIs(result, OK_RESPONSE)
+
     def test_run_method_with_different_topics(self) -> None:
         """
         Test that run method works with different topics.
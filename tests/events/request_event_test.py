@@ -1,4 +1,5 @@
 import asyncio
+from json import loads
 from typing import Any, override
 from unittest import TestCase
 from unittest.mock import AsyncMock, Mock, patch
@@ -323,7 +324,7 @@ class RequestEventTest(TestCase):
             mock_client.actions = {"test_action": mock_action_class}
 
             # Mock dumps to return a JSON string
-            mock_dumps.return_value = '{"response": "data"}'
+            mock_dumps.return_value = b'{"response": "data"}'
 
             result = await self.request_event.run(mock_client, mock_websocket)
 
@@ -359,7 +360,7 @@ class RequestEventTest(TestCase):
             mock_client.actions = {}
 
             # Mock dumps to return a JSON string
-            mock_dumps.return_value = '{"response": "data"}'
+            mock_dumps.return_value = b'{"response": "data"}'
 
             result = await self.request_event.run(mock_client, mock_websocket)
 
@@ -395,7 +396,7 @@ class RequestEventTest(TestCase):
             mock_client.actions = {"test_action": mock_action}
 
             # Mock dumps to return a JSON string
-            mock_dumps.return_value = '{"response": "data"}'
+            mock_dumps.return_value = b'{"response": "data"}'
 
             result = await self.request_event.run(mock_client, mock_websocket)
 
@@ -436,7 +437,7 @@ class RequestEventTest(TestCase):
             mock_client.actions = {"test_action": mock_action}
 
             # Mock dumps to return a JSON string
-            mock_dumps.return_value = '{"response": "data"}'
+            mock_dumps.return_value = b'{"response": "data"}'
 
             await self.request_event.run(mock_client, mock_websocket)
 
@@ -447,8 +448,71 @@ class RequestEventTest(TestCase):
             self.assertIn("payload", call_args)
             self.assertEqual(call_args["ref"], "test_ref")
 
+            # Response should be sent as a text frame
+            mock_websocket.send.assert_called_once_with('{"response": "data"}')
+
         asyncio.run(async_test())
 
+    def run_with_response(self, response: ActionResponse) -> tuple[ActionResponse, dict[str, Any]]:
+        """
+        Runs the request event against an action returning the given response.
+
+        Parameters:
+            response (ActionResponse): The response the action returns.
+
+        Returns:
+            tuple[ActionResponse, dict[str, Any]]: The returned response and the decoded message that was sent.
+        """
+        mock_client = Mock()
+        mock_websocket = AsyncMock()
+        mock_action = Mock()
+        mock_action.run = AsyncMock(return_value = response)
+        mock_client.actions = {"test_action": Mock(return_value = mock_action)}
+
+        result = asyncio.run(self.request_event.run(mock_client, mock_websocket))
+
+        mock_websocket.send.assert_called_once()
+        return result, loads(mock_websocket.send.call_args[0][0])
+
+    def test_run_method_encodes_non_string_keys(self) -> None:
+        """
+        Test that run method encodes fields with nested non-string dictionary keys.
+
+        Returns:
+            None: This test does not return a value.
+        """
+        result, sent = self.run_with_response(ActionResponse(status_code = 200, fields = {"a": {1: "b"}}))
+
+        self.assertEqual(result.status_code, 200)
+        self.assertEqual(sent["payload"]["fields"], {"a": {"1": "b"}})
+
+    def test_run_method_encodes_large_integers(self) -> None:
+        """
+        Test that run method encodes integers wider than 64 bits.
+
+        Returns:
+            None: This test does not return a value.
+        """
+        result, sent = self.run_with_response(ActionResponse(status_code = 200, fields = {"big": 2 ** 70}))
+
+        self.assertEqual(result.status_code, 200)
+        self.assertEqual(sent["payload"]["fields"], {"big": 2 ** 70})
+
+    def test_run_method_with_unencodable_response(self) -> None:
+        """
+        Test that run method sends an internal server error when the response cannot be encoded.
+
+        Returns:
+            None: This test does not return a value.
+        """
+        result, sent = self.run_with_response(ActionResponse(status_code = 200, fields = object()))
+
+        self.assertEqual(result.status_code, 500)
+        self.assertEqual(sent["event"], "response")
+        self.assertEqual(sent["ref"], "test_ref")
+        self.assertEqual(sent["payload"]["status_code"], 500)
+        self.assertEqual(sent["payload"]["message"], "Internal server error")
+
     def test_request_event_override_decorator(self) -> None:
         """
         Test that RequestEvent methods use @override decorator correctly.